@@ -5,38 +5,161 @@ and formats it for social media posting.
 """
 
 import argparse
+import hashlib
+import os
+import pickle
 import random
 import re
 import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
+from typing import Optional
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer, UnicodeDammit
+from lxml import etree, html
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 BASE_URL = "https://www.oca.org"
 TAGS = "#Christian #OrthodoxChristian #Orthodox #Orthostr #Saint"
+MAX_WORKERS = 4
+CACHE_DIR = ".saint_cache"
+CACHE_EXPIRE_AFTER = 7 * 24 * 60 * 60  # seconds
+# Caching is best-effort: an unwritable, missing or corrupt entry is just a miss
+_CACHE_ERRORS = (OSError, EOFError, IndexError, TypeError, ValueError, pickle.UnpicklingError)
+_WS_RE = re.compile(r"\s+")
+_COMMENT_RE = re.compile(r"<!--.*?-->")
+_LIFE_HREF_RE = re.compile(r"/saints/lives/\d{4}/\d{2}/\d{2}/\d+-.+")
+_SAINT_CLASS_RE = re.compile(r"\bsaint\b")
+_ICON_SIZE_RE = re.compile(r"/icons/(?:xsm|sm|md)/")
+_SLASH_RE = re.compile(r"\s*/\s*")
+
+# Shared session so the troparia fetch reuses the keep-alive connection
+# opened by the lives fetch instead of paying a fresh TLS handshake.
+SESSION = requests.Session()
+SESSION.headers.update({"User-Agent": "daily_saint_bot", "Accept-Encoding": "gzip, deflate"})
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=2,
+        pool_maxsize=MAX_WORKERS,
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+    ),
+)
+
+
+class SaintNotFoundError(Exception):
+    """Raised when a lives page lists no saints."""
+
+
+def _cache_path(url: str) -> str:
+    return os.path.join(CACHE_DIR, hashlib.sha1(url.encode()).hexdigest())
+
+
+def _read_cache(url: str) -> Optional[tuple]:
+    """Return the unexpired (etag, last_modified, body, encoding) entry for url, if any."""
+    path = _cache_path(url)
+    try:
+        # The file's mtime is the entry's age, so expiry never has to load the body
+        if time.time() - os.path.getmtime(path) > CACHE_EXPIRE_AFTER:
+            return None
+        with open(path, "rb") as f:
+            etag, last_modified, body, encoding = pickle.load(f)
+    except _CACHE_ERRORS:
+        return None
+    return etag, last_modified, body, encoding
+
+
+def _write_cache(
+    url: str, etag: Optional[str], last_modified: Optional[str], body: bytes, encoding: Optional[str]
+) -> None:
+    """Store url's body and validators; the entry is replaced atomically so other runs never see half of it."""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=CACHE_DIR, suffix=".tmp", delete=False) as f:
+            pickle.dump((etag, last_modified, body, encoding), f)
+        os.replace(f.name, _cache_path(url))
+    except OSError:
+        pass
+
+
+def _touch_cache(url: str) -> None:
+    """Mark url's entry as freshly revalidated."""
+    try:
+        os.utime(_cache_path(url))
+    except OSError:
+        pass
+
+
+def prune_cache() -> None:
+    """Delete cache entries (and stray temp files) older than CACHE_EXPIRE_AFTER."""
+    cutoff = time.time() - CACHE_EXPIRE_AFTER
+    try:
+        with os.scandir(CACHE_DIR) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_file() and entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+                except OSError:
+                    continue
+    except OSError:
+        pass
+
+
+def fetch_content(url: str) -> tuple[bytes, Optional[str]]:
+    """Return (body, declared_encoding) for url, revalidating a cached copy with a conditional GET.
+
+    declared_encoding is the Content-Type charset, or None when the server sent none.
+    """
+    cached = _read_cache(url)
+
+    headers = {}
+    if cached:
+        etag, last_modified, _, _ = cached
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    response = SESSION.get(url, headers=headers, timeout=10)
+    if cached and response.status_code == 304:
+        _touch_cache(url)
+        return cached[2], cached[3]
+    response.raise_for_status()
 
+    # requests assumes ISO-8859-1 for text/* without a charset; only trust one the server sent
+    encoding = response.encoding if "charset=" in response.headers.get("Content-Type", "").lower() else None
+
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if etag or last_modified:
+        _write_cache(url, etag, last_modified, response.content, encoding)
+
+    return response.content, encoding
 
-def fetch_page(url: str) -> BeautifulSoup:
-    response = requests.get(url, timeout=10)
-    response.raise_for_status()
-    return BeautifulSoup(response.text, "html.parser")
+
+def fetch_page(url: str, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    content, encoding = fetch_content(url)
+    return BeautifulSoup(content, "lxml", parse_only=parse_only, from_encoding=encoding)
 
 
 def parse_saint_article(article) -> tuple[str, str, str]:
     """Extract (saint_name, slug_path, icon_url) from a saint <article> element."""
     name_tag = article.find("h2", class_="name")
-    saint_name = re.sub(r"\s+", " ", name_tag.get_text(strip=True)) if name_tag else ""
-    saint_name = re.sub(r"<!--.*?-->", "", saint_name).strip()
+    saint_name = _WS_RE.sub(" ", name_tag.get_text(strip=True)) if name_tag else ""
+    saint_name = _COMMENT_RE.sub("", saint_name).strip()
 
-    life_link = article.find("a", href=re.compile(r"/saints/lives/\d{4}/\d{2}/\d{2}/\d+-.+"))
+    life_link = article.find("a", href=_LIFE_HREF_RE)
     slug_path = life_link["href"] if life_link else ""
 
     img = article.find("figure", class_="thumbnail")
     img_tag = img.find("img") if img else None
     icon_url = ""
     if img_tag and img_tag.get("src"):
-        icon_url = re.sub(r"/icons/(xsm|sm|md)/", "/icons/lg/", img_tag["src"])
+        icon_url = _ICON_SIZE_RE.sub("/icons/lg/", img_tag["src"])
         if not icon_url.startswith("http"):
             icon_url = f"https:{icon_url}" if icon_url.startswith("//") else f"https://images.oca.org{icon_url}"
 
@@ -46,12 +169,12 @@ def parse_saint_article(article) -> tuple[str, str, str]:
 def get_all_saints(day: date) -> list[tuple[str, str, str]]:
     """Return a list of (saint_name, slug_path, icon_url) for all saints on the given day."""
     url = f"{BASE_URL}/saints/lives/{day.year}/{day.month:02d}/{day.day:02d}"
-    soup = fetch_page(url)
+    # Only build the tree for saint articles; the rest of the page is never read
+    soup = fetch_page(url, parse_only=SoupStrainer("article", class_=_SAINT_CLASS_RE))
 
-    articles = soup.find_all("article", class_=re.compile(r"\bsaint\b"))
+    articles = soup.find_all("article", class_=_SAINT_CLASS_RE)
     if not articles:
-        print(f"ERROR: Could not find any saint on {url}", file=sys.stderr)
-        sys.exit(1)
+        raise SaintNotFoundError(f"Could not find any saint on {url}")
 
     return [parse_saint_article(a) for a in articles]
 
@@ -59,7 +182,7 @@ def get_all_saints(day: date) -> list[tuple[str, str, str]]:
 def clean_chant_text(text: str) -> str:
     """Replace chant line-break markers (/) with actual newlines."""
     # " / " marks a line break in OCA chant notation
-    text = re.sub(r"\s*/\s*", "\n", text)
+    text = _SLASH_RE.sub("\n", text)
     # Strip trailing whitespace from each line
     text = "\n".join(line.rstrip() for line in text.splitlines())
     return text.strip()
@@ -69,19 +192,28 @@ def get_troparia(slug_path: str) -> tuple[str, str]:
     """Return (troparion_text, kontakion_text) from the troparia page."""
     troparia_path = slug_path.replace("/saints/lives/", "/saints/troparia/")
     url = f"{BASE_URL}{troparia_path}"
-    soup = fetch_page(url)
+    content, encoding = fetch_content(url)
+    # Without a declared charset lxml would assume Latin-1; sniff it the way BeautifulSoup does
+    if content and not encoding:
+        encoding = UnicodeDammit(content, is_html=True).original_encoding
+    try:
+        tree = html.fromstring(content, parser=html.HTMLParser(encoding=encoding))
+    except etree.ParserError:
+        # An empty page has no chants; the post is still produced without them
+        return "", ""
 
     troparion = ""
     kontakion = ""
 
-    # Each troparion/kontakion is in its own <article> with an <h2> heading and <p> body
-    for article in soup.find_all("article"):
-        h2 = article.find("h2")
-        if not h2:
+    # Each troparion/kontakion is in its own <article> with an <h2> heading and <p> body.
+    # Walked with lxml directly; BeautifulSoup buys nothing on this page.
+    for article in tree.iter("article"):
+        h2 = article.find(".//h2")
+        if h2 is None:
             continue
-        label = h2.get_text(strip=True).lower()
-        p = article.find("p")
-        text = clean_chant_text(p.get_text(strip=True)) if p else ""
+        label = h2.text_content().strip().lower()
+        p = article.find(".//p")
+        text = clean_chant_text("".join(s.strip() for s in p.itertext())) if p is not None else ""
 
         if "troparion" in label and not troparion:
             troparion = text
@@ -115,6 +247,20 @@ def format_output(saint_name: str, slug_path: str, icon_url: str, troparion: str
 
 
 def parse_date(date_str: str) -> date:
+    # Fast path for the documented YYYY-MM-DD form; strptime handles everything else
+    if (
+        len(date_str) == 10
+        and date_str.isascii()
+        and date_str[4] == "-"
+        and date_str[7] == "-"
+        and date_str[:4].isdigit()
+        and date_str[5:7].isdigit()
+        and date_str[8:].isdigit()
+    ):
+        try:
+            return date.fromisoformat(date_str)
+        except ValueError:
+            pass
     for fmt in ("%Y-%m-%d", "%m/%d/%Y", "%m/%d/%y"):
         try:
             return datetime.strptime(date_str, fmt).date()
@@ -124,12 +270,34 @@ def parse_date(date_str: str) -> date:
     sys.exit(1)
 
 
+def build_post(day: date, pick_random: bool) -> str:
+    """Fetch the chosen saint for one day and return the formatted post."""
+    print(f"Fetching saint for {day.strftime('%B %d, %Y')}...", file=sys.stderr)
+
+    saints = get_all_saints(day)
+
+    if pick_random and len(saints) > 1:
+        saint_name, slug_path, icon_url = random.choice(saints[1:])
+        print(f"Random saint for {day.isoformat()}: {saint_name}", file=sys.stderr)
+    else:
+        saint_name, slug_path, icon_url = saints[0]
+        if pick_random:
+            print(f"Only one saint on {day.isoformat()}, using: {saint_name}", file=sys.stderr)
+        else:
+            print(f"Top saint for {day.isoformat()}: {saint_name}", file=sys.stderr)
+
+    troparion, kontakion = get_troparia(slug_path)
+
+    return format_output(saint_name, slug_path, icon_url, troparion, kontakion, day)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Fetch the top saint of the day from oca.org")
     parser.add_argument(
-        "date",
-        nargs="?",
-        help="Date to fetch (YYYY-MM-DD). Defaults to today.",
+        "dates",
+        nargs="*",
+        metavar="date",
+        help="Date(s) to fetch (YYYY-MM-DD). Defaults to today.",
     )
     parser.add_argument(
         "-o", "--output",
@@ -142,32 +310,37 @@ def main():
     )
     args = parser.parse_args()
 
-    day = parse_date(args.date) if args.date else date.today()
+    days = [parse_date(d) for d in args.dates] or [date.today()]
 
-    print(f"Fetching saint for {day.strftime('%B %d, %Y')}...", file=sys.stderr)
+    prune_cache()
 
-    saints = get_all_saints(day)
+    # Each day needs two sequential requests (lives, then troparia). Several days are
+    # fetched concurrently so their round trips overlap; workers share SESSION's pool.
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = [executor.submit(build_post, day, args.random) for day in days]
 
-    if args.random and len(saints) > 1:
-        saint_name, slug_path, icon_url = random.choice(saints[1:])
-        print(f"Random saint: {saint_name}", file=sys.stderr)
-    else:
-        saint_name, slug_path, icon_url = saints[0]
-        if args.random:
-            print(f"Only one saint today, using: {saint_name}", file=sys.stderr)
+    # A failed date is reported on its own; posts for the other dates are still written.
+    posts = []
+    failed = False
+    for future in futures:
+        try:
+            posts.append(future.result())
+        except (SaintNotFoundError, requests.RequestException) as e:
+            print(f"ERROR: {e}", file=sys.stderr)
+            failed = True
+
+    if posts:
+        output = "\n\n".join(posts)
+
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                f.write(output + "\n")
+            print(f"Saved to {args.output}", file=sys.stderr)
         else:
-            print(f"Top saint: {saint_name}", file=sys.stderr)
-
-    troparion, kontakion = get_troparia(slug_path)
-
-    output = format_output(saint_name, slug_path, icon_url, troparion, kontakion, day)
+            print(output)
 
-    if args.output:
-        with open(args.output, "w", encoding="utf-8") as f:
-            f.write(output + "\n")
-        print(f"Saved to {args.output}", file=sys.stderr)
-    else:
-        print(output)
+    if failed:
+        sys.exit(1)
 
 
 if __name__ == "__main__":